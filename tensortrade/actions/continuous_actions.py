@@ -47,9 +47,11 @@ class ContinuousActions(ActionScheme):
         if isinstance(self._instrument, list):
             self._instrument = self._instrument[0]
 
+        self._n_trade_types = len(TradeType)
+
     def get_trade(self, current_step: int, action: TradeActionUnion) -> Trade:
         action_type, trade_amount = action
-        trade_type = TradeType(int(action_type * len(TradeType)))
+        trade_type = TradeType(int(action_type * self._n_trade_types))
 
         current_price = self._exchange.current_price(symbol=self._instrument)
         base_precision = self._exchange.base_precision
@@ -67,7 +69,6 @@ class ContinuousActions(ActionScheme):
         elif trade_type is TradeType.MARKET_SELL or trade_type is TradeType.LIMIT_SELL:
             price_adjustment = 1 - (self.max_allowed_slippage_percent / 100)
             price = round(current_price * price_adjustment, base_precision)
-            amount_held = self._exchange.portfolio.get(self._instrument, 0)
-            amount = round(amount_held * trade_amount, instrument_precision)
+            amount = round(amount * trade_amount, instrument_precision)
 
         return Trade(current_step, self._instrument, trade_type, amount, price)
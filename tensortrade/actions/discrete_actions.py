@@ -11,9 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License
+import math
 import numpy as np
 
-from typing import Union
 from gym.spaces import Discrete
 
 from tensortrade.actions import ActionScheme, TradeActionUnion, DTypeString
@@ -46,6 +46,13 @@ class DiscreteActions(ActionScheme):
         if isinstance(self._instrument, list):
             self._instrument = self._instrument[0]
 
+        n_splits = self.n_actions / len(TradeType)
+
+        self._trade_types = [TradeType(action % len(TradeType)) for action in range(self.n_actions)]
+        self._trade_amounts = [(action // len(TradeType) + 1) / n_splits for action in range(self.n_actions)]
+
+        self._amount_scale = None
+
     @property
     def dtype(self) -> DTypeString:
         """A type or str corresponding to the dtype of the `action_space`."""
@@ -57,18 +64,28 @@ class DiscreteActions(ActionScheme):
             'Cannot change the dtype of a `DiscreteActions` due to '
             'the requirements of `gym.spaces.Discrete` spaces. ')
 
+    def reset(self):
+        self._amount_scale = None
+
+    def _round_amount(self, amount: float) -> float:
+        if not math.isfinite(amount):
+            return amount
+
+        return math.floor(amount * self._amount_scale + 0.5) / self._amount_scale
+
     def get_trade(self, current_step: int, action: TradeActionUnion) -> Trade:
         """The trade type is determined by `action % len(TradeType)`, and the trade amount is determined by the multiplicity of the action.
 
         For example, 1 = LIMIT_BUY|0.25, 2 = MARKET_BUY|0.25, 6 = LIMIT_BUY|0.5, 7 = MARKET_BUY|0.5, etc.
         """
-        n_splits = self.n_actions / len(TradeType)
-        trade_type = TradeType(action % len(TradeType))
-        trade_amount = int(action / len(TradeType)) * float(1 / n_splits) + (1 / n_splits)
+        trade_type = self._trade_types[action]
+        trade_amount = self._trade_amounts[action]
 
         current_price = self._exchange.current_price(symbol=self._instrument)
         base_precision = self._exchange.base_precision
-        instrument_precision = self._exchange.instrument_precision
+
+        if self._amount_scale is None:
+            self._amount_scale = 10 ** self._exchange.instrument_precision
 
         amount = self._exchange.instrument_balance(self._instrument)
         price = current_price
@@ -76,13 +93,11 @@ class DiscreteActions(ActionScheme):
         if trade_type is TradeType.MARKET_BUY or trade_type is TradeType.LIMIT_BUY:
             price_adjustment = 1 + (self.max_allowed_slippage_percent / 100)
             price = max(round(current_price * price_adjustment, base_precision), base_precision)
-            amount = round(self._exchange.balance * 0.99 *
-                           trade_amount / price, instrument_precision)
+            amount = self._round_amount(self._exchange.balance * 0.99 * trade_amount / price)
 
         elif trade_type is TradeType.MARKET_SELL or trade_type is TradeType.LIMIT_SELL:
             price_adjustment = 1 - (self.max_allowed_slippage_percent / 100)
             price = round(current_price * price_adjustment, base_precision)
-            amount_held = self._exchange.portfolio.get(self._instrument, 0)
-            amount = round(amount_held * trade_amount, instrument_precision)
+            amount = self._round_amount(amount * trade_amount)
 
         return Trade(current_step, self._instrument, trade_type, amount, price)
@@ -50,6 +50,14 @@ class MultiDiscreteActions(ActionScheme):
             self.context.get('max_allowed_slippage_percent', None) or \
             max_allowed_slippage_percent
 
+        self._n_trade_types = len(TradeType)
+
+        if self._actions_per_instrument < self._n_trade_types:
+            raise ValueError('`actions_per_instrument` must be at least {}, one action per trade type.'.format(
+                self._n_trade_types))
+
+        self._inv_n_splits = 1 / int(self._actions_per_instrument / self._n_trade_types)
+
     @property
     def dtype(self) -> DTypeString:
         """A type or str corresponding to the dtype of the `action_space`."""
@@ -77,10 +85,8 @@ class MultiDiscreteActions(ActionScheme):
         instrument_idx = int(action / self._actions_per_instrument)
         instrument = self._instruments[instrument_idx]
 
-        n_splits = int(self._actions_per_instrument / len(TradeType))
-        trade_type = TradeType(action % len(TradeType))
-        trade_amount = int(action / len(TradeType)) * \
-            float(1 / n_splits) + (1 / n_splits)
+        trade_type = TradeType(action % self._n_trade_types)
+        trade_amount = int(action / self._n_trade_types) * self._inv_n_splits + self._inv_n_splits
         trade_amount = trade_amount - instrument_idx
 
         current_price = self._exchange.current_price(symbol=instrument)
@@ -99,7 +105,6 @@ class MultiDiscreteActions(ActionScheme):
         elif trade_type is TradeType.MARKET_SELL or trade_type is TradeType.LIMIT_SELL:
             price_adjustment = 1 - (self._max_allowed_slippage_percent / 100)
             price = round(current_price * price_adjustment, base_precision)
-            amount_held = self._exchange.portfolio.get(instrument, 0)
-            amount = round(amount_held * trade_amount, instrument_precision)
+            amount = round(amount * trade_amount, instrument_precision)
 
         return Trade(current_step, instrument, trade_type, amount, price)
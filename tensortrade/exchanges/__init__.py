@@ -4,6 +4,7 @@ import pandas as pd
 from datetime import datetime
 
 from .exchange import Exchange
+from .vectorized_exchange import VectorizedExchange
 
 from . import live
 from . import simulated
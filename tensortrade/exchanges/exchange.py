@@ -45,6 +45,8 @@ class Exchange(Component):
         self._max_trade_amount = self.default('max_trade_amount', 1e6, kwargs)
         self._min_trade_price = self.default('min_trade_price', 1e-8, kwargs)
         self._max_trade_price = self.default('max_trade_price', 1e8, kwargs)
+        self._observation_space = None
+        self._inv_initial_balance_x100 = None
 
     @property
     def base_instrument(self) -> str:
@@ -63,6 +65,7 @@ class Exchange(Component):
     @window_size.setter
     def window_size(self, window_size: int):
         self._window_size = window_size
+        self._observation_space = None
 
     @property
     def dtype(self) -> TypeString:
@@ -72,6 +75,7 @@ class Exchange(Component):
     @dtype.setter
     def dtype(self, dtype: TypeString):
         self._dtype = dtype
+        self._observation_space = None
 
     @property
     def feature_pipeline(self) -> FeaturePipeline:
@@ -81,6 +85,7 @@ class Exchange(Component):
     @feature_pipeline.setter
     def feature_pipeline(self, feature_pipeline: FeaturePipeline):
         self._feature_pipeline = feature_pipeline
+        self._observation_space = None
 
     @property
     def base_precision(self) -> float:
@@ -139,16 +144,18 @@ class Exchange(Component):
     @property
     def observation_space(self) -> Box:
         """The final shape of the observations generated by the exchange, after any feature transformations."""
+        if self._observation_space is not None:
+            return self._observation_space
+
         n_features = len(self.observation_columns)
+        shape = (self._window_size, n_features) if self._window_size > 1 else (n_features,)
 
-        low = np.tile(self._min_trade_price, n_features)
-        high = np.tile(self._max_trade_price, n_features)
+        low = np.full(shape, self._min_trade_price, dtype=self._dtype)
+        high = np.full(shape, self._max_trade_price, dtype=self._dtype)
 
-        if self._window_size > 1:
-            low = np.tile(low, self._window_size).reshape((self._window_size, n_features))
-            high = np.tile(high, self._window_size).reshape((self._window_size, n_features))
+        self._observation_space = Box(low=low, high=high, dtype=self._dtype)
 
-        return Box(low=low, high=high, dtype=self._dtype)
+        return self._observation_space
 
     @property
     def net_worth(self) -> float:
@@ -157,20 +164,17 @@ class Exchange(Component):
         Returns:
             The total portfolio value of the active account on the exchange.
         """
-        net_worth = self.balance
         portfolio = self.portfolio
 
         if not portfolio:
-            return net_worth
-
-        for symbol, amount in portfolio.items():
-            if symbol == self._base_instrument:
-                continue
+            return self.balance
 
-            current_price = self.current_price(symbol=symbol)
-            net_worth += current_price * amount
+        base_instrument = self._base_instrument
+        current_price = self.current_price
 
-        return net_worth
+        return self.balance + sum(current_price(symbol=symbol) * amount
+                                  for symbol, amount in portfolio.items()
+                                  if symbol != base_instrument)
 
     @property
     def profit_loss_percent(self) -> float:
@@ -179,7 +183,10 @@ class Exchange(Component):
         Returns:
             The percentage change in net worth since the last reset.
         """
-        return float(self.net_worth / self.initial_balance) * 100
+        if self._inv_initial_balance_x100 is None:
+            self._inv_initial_balance_x100 = 100 / self.initial_balance
+
+        return float(self.net_worth * self._inv_initial_balance_x100)
 
     @property
     @abstractmethod
@@ -204,8 +211,8 @@ class Exchange(Component):
         observation = self._next_observation()
 
         if isinstance(observation, pd.DataFrame):
-            observation = observation.fillna(0, axis=1)
-            return observation.values
+            observation = observation.to_numpy()
+            return np.where(pd.isnull(observation), 0, observation)
 
         return observation
 
@@ -218,12 +225,7 @@ class Exchange(Component):
         Returns:
             The balance of the specified exchange symbol, denoted in the base instrument.
         """
-        portfolio = self.portfolio
-
-        if symbol in portfolio.keys():
-            return portfolio[symbol]
-
-        return 0
+        return self.portfolio.get(symbol, 0)
 
     @abstractmethod
     def current_price(self, symbol: str) -> float:
@@ -254,3 +256,5 @@ class Exchange(Component):
         """Reset the feature pipeline, initial balance, trades, performance, and any other temporary stateful data."""
         if self._feature_pipeline is not None:
             self.feature_pipeline.reset()
+
+        self._inv_initial_balance_x100 = None
@@ -60,6 +60,7 @@ class SimulatedExchange(Exchange):
     @window_size.setter
     def window_size(self, window_size: int):
         self._window_size = window_size
+        self._observation_space = None
 
         if isinstance(self.data_frame, pd.DataFrame) and self._pretransform:
             self.transform_data_frame()
@@ -71,6 +72,9 @@ class SimulatedExchange(Exchange):
 
     @data_frame.setter
     def data_frame(self, data_frame: pd.DataFrame):
+        self._observation_space = None
+        self._current_price_cache = (None, None)
+
         if not isinstance(data_frame, pd.DataFrame):
             self._data_frame = data_frame
             self._price_history = None
@@ -91,6 +95,7 @@ class SimulatedExchange(Exchange):
     @feature_pipeline.setter
     def feature_pipeline(self, feature_pipeline=FeaturePipeline):
         self._feature_pipeline = feature_pipeline
+        self._observation_space = None
 
         if isinstance(self.data_frame, pd.DataFrame) and self._pretransform:
             self.transform_data_frame()
@@ -158,9 +163,16 @@ class SimulatedExchange(Exchange):
             self._data_frame = self._feature_pipeline.transform(self._pre_transformed_data)
 
     def current_price(self, symbol: str) -> float:
-        if self._price_history is not None:
-            return float(self._price_history.iloc[self._current_step])
-        return np.inf
+        if self._price_history is None:
+            return np.inf
+
+        cache_step, price = self._current_price_cache
+
+        if cache_step != self._current_step:
+            price = float(self._price_history.iloc[self._current_step])
+            self._current_price_cache = (self._current_step, price)
+
+        return price
 
     def _is_valid_trade(self, trade: Trade) -> bool:
         if trade.is_buy and self._balance < trade.amount * trade.price:
@@ -210,8 +222,7 @@ class SimulatedExchange(Exchange):
         if filled_trade.is_buy:
             price_adjustment = (1 + commission)
             filled_trade.price = round(current_price * price_adjustment, self._base_precision)
-            filled_trade.amount = round((filled_trade.price * filled_trade.amount) / filled_trade.price,
-                                        self._instrument_precision)
+            filled_trade.amount = round(filled_trade.amount, self._instrument_precision)
         elif filled_trade.is_sell:
             price_adjustment = (1 - commission)
             filled_trade.price = round(current_price * price_adjustment, self._base_precision)
@@ -228,6 +239,7 @@ class SimulatedExchange(Exchange):
         super().reset()
 
         self._current_step = 0
+        self._current_price_cache = (None, None)
         self._balance = self.initial_balance
         self._portfolio = {self.base_instrument: self.balance}
         self._trades = pd.DataFrame([], columns=['step', 'symbol', 'type', 'amount', 'price'])
@@ -0,0 +1,105 @@
+# Copyright 2019 The TensorTrade Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pandas as pd
+import numpy as np
+
+from typing import List
+
+from tensortrade.exchanges.exchange import Exchange, TypeString
+
+
+class VectorizedExchange(object):
+    """A batch of exchanges stepped in lockstep, with their observations served as a single contiguous array.
+
+    Arguments:
+        exchanges: The exchanges to step together. Each must share the same window size and observation columns.
+        dtype: A type or str corresponding to the dtype of the batched observations.
+            Defaults to the dtype of the first exchange.
+    """
+
+    def __init__(self, exchanges: List[Exchange], dtype: TypeString = None):
+        if len(exchanges) == 0:
+            raise ValueError('A `VectorizedExchange` requires at least one exchange.')
+
+        if len({exchange.window_size for exchange in exchanges}) > 1:
+            raise ValueError('All exchanges of a `VectorizedExchange` must share the same window size.')
+
+        if len({len(exchange.observation_columns) for exchange in exchanges}) > 1:
+            raise ValueError('All exchanges of a `VectorizedExchange` must share the same observation columns.')
+
+        self._exchanges = list(exchanges)
+        self._dtype = dtype or self._exchanges[0].dtype
+        self._observations = None
+
+    @property
+    def exchanges(self) -> List[Exchange]:
+        """The exchanges being stepped together."""
+        return self._exchanges
+
+    @property
+    def n_exchanges(self) -> int:
+        """The number of exchanges in the batch."""
+        return len(self._exchanges)
+
+    @property
+    def window_size(self) -> int:
+        """The window size shared by the observations of every exchange."""
+        return self._exchanges[0].window_size
+
+    @property
+    def dtype(self) -> TypeString:
+        """A type or str corresponding to the dtype of the batched observations."""
+        return self._dtype
+
+    @property
+    def has_next_observation(self) -> bool:
+        """If `False`, at least one of the exchanges has run out of observations."""
+        return all(exchange.has_next_observation for exchange in self._exchanges)
+
+    def batched_next_observation(self) -> np.ndarray:
+        """Generate the next observation from every exchange.
+
+        The returned array is reused between calls, so it must be copied if it is needed after the next call.
+
+        Returns:
+            An array of shape `(n_exchanges, window_size, n_features)`, with missing values filled with zero.
+        """
+        window_size = self.window_size
+
+        for idx, exchange in enumerate(self._exchanges):
+            observation = exchange._next_observation()
+
+            if isinstance(observation, pd.DataFrame):
+                observation = observation.to_numpy()
+
+            observation = observation[-window_size:]
+            shape = (len(self._exchanges), window_size, observation.shape[-1])
+
+            if idx == 0 and (self._observations is None or self._observations.shape != shape):
+                self._observations = np.empty(shape, dtype=self._dtype)
+            elif self._observations.shape != shape:
+                raise ValueError('Exchange {} produced an observation of shape {}, expected {}.'.format(
+                    idx, observation.shape, self._observations.shape[1:]))
+
+            self._observations[idx] = observation
+
+        np.copyto(self._observations, 0, where=np.isnan(self._observations))
+
+        return self._observations
+
+    def reset(self):
+        """Reset every exchange in the batch."""
+        for exchange in self._exchanges:
+            exchange.reset()
@@ -16,6 +16,8 @@
 class Trade(object):
     """A trade object for use within trading environments."""
 
+    __slots__ = ('_step', '_symbol', '_trade_type', '_amount', '_price')
+
     def __init__(self, step: int, symbol: str, trade_type: 'TradeType', amount: float, price: float):
         """
         Arguments:
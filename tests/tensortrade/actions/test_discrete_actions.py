@@ -1,3 +1,74 @@
+import numpy as np
+import pandas as pd
 
 from tensortrade import TradingContext
 from tensortrade.actions import DiscreteActions
+from tensortrade.exchanges.simulated import SimulatedExchange
+from tensortrade.trades import TradeType
+
+
+def test_trade_type_and_amount_lookup():
+    with TradingContext(base_instrument='USD', instruments='BTC'):
+        action_scheme = DiscreteActions(n_actions=20)
+
+    assert action_scheme._trade_types[0] is TradeType.HOLD
+    assert action_scheme._trade_types[1] is TradeType.LIMIT_BUY
+    assert action_scheme._trade_types[7] is TradeType.MARKET_BUY
+    assert action_scheme._trade_types[19] is TradeType.MARKET_SELL
+
+    assert action_scheme._trade_amounts[1] == 0.25
+    assert action_scheme._trade_amounts[6] == 0.5
+    assert action_scheme._trade_amounts[19] == 1.0
+
+
+def test_get_trade():
+    data_frame = pd.DataFrame({
+        'open': np.full(10, 100.0),
+        'high': np.full(10, 100.0),
+        'low': np.full(10, 100.0),
+        'close': np.full(10, 100.0),
+        'volume': np.full(10, 1000.0)
+    })
+
+    with TradingContext(base_instrument='USD', instruments='BTC'):
+        action_scheme = DiscreteActions(n_actions=20)
+        exchange = SimulatedExchange(data_frame=data_frame, initial_balance=1e4)
+
+    exchange.reset()
+    action_scheme.exchange = exchange
+
+    buy = action_scheme.get_trade(current_step=0, action=2)
+
+    assert buy.trade_type is TradeType.MARKET_BUY
+    assert buy.price == 101.0
+    assert buy.amount == 24.5049505
+
+    exchange.portfolio['BTC'] = 3.0
+
+    sell = action_scheme.get_trade(current_step=0, action=13)
+
+    assert sell.trade_type is TradeType.LIMIT_SELL
+    assert sell.price == 99.0
+    assert sell.amount == 2.25
+
+
+def test_get_trade_with_missing_price():
+    data_frame = pd.DataFrame({
+        'open': np.full(10, 100.0),
+        'high': np.full(10, 100.0),
+        'low': np.full(10, 100.0),
+        'close': np.full(10, np.nan),
+        'volume': np.full(10, 1000.0)
+    })
+
+    with TradingContext(base_instrument='USD', instruments='BTC'):
+        action_scheme = DiscreteActions(n_actions=20)
+        exchange = SimulatedExchange(data_frame=data_frame, initial_balance=1e4)
+
+    exchange.reset()
+    action_scheme.exchange = exchange
+
+    buy = action_scheme.get_trade(current_step=0, action=2)
+
+    assert buy.trade_type is TradeType.MARKET_BUY
+    assert np.isnan(buy.amount)
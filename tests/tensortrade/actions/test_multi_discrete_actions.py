@@ -1,3 +1,11 @@
+import pytest
 
 from tensortrade import TradingContext
 from tensortrade.actions import MultiDiscreteActions
+
+
+def test_rejects_too_few_actions_per_instrument():
+
+    with TradingContext(base_instrument='USD', instruments=['BTC', 'ETH']):
+        with pytest.raises(ValueError):
+            MultiDiscreteActions(actions_per_instrument=4)
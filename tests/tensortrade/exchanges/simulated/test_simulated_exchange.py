@@ -1,4 +1,80 @@
-
+import numpy as np
+import pandas as pd
 
 from tensortrade import TradingContext
-from tensortrade.exchanges.simulated import SimulatedExchange
+from tensortrade.exchanges.simulated import SimulatedExchange, FBMExchange
+
+
+def make_data_frame(offset: float) -> pd.DataFrame:
+    return pd.DataFrame({
+        'open': np.arange(10) + offset,
+        'high': np.arange(10) + offset + 0.5,
+        'low': np.arange(10) + offset - 0.5,
+        'close': np.arange(10) + offset + 0.1,
+        'volume': np.full(10, 1000.0)
+    })
+
+
+def test_current_price_follows_current_step():
+
+    with TradingContext(base_instrument='USD', instruments='BTC'):
+        exchange = SimulatedExchange(data_frame=make_data_frame(0))
+
+    exchange.reset()
+
+    assert exchange.current_price(symbol='BTC') == 0.1
+
+    exchange._current_step = 3
+
+    assert exchange.current_price(symbol='BTC') == 3.1
+
+
+def test_current_price_after_new_data_frame():
+
+    with TradingContext(base_instrument='USD', instruments='BTC'):
+        exchange = SimulatedExchange(data_frame=make_data_frame(0))
+
+    exchange.reset()
+    exchange._current_step = 3
+
+    assert exchange.current_price(symbol='BTC') == 3.1
+
+    exchange.data_frame = make_data_frame(100)
+
+    assert exchange.current_price(symbol='BTC') == 103.1
+
+
+def test_current_price_after_fbm_reset():
+
+    with TradingContext(base_instrument='USD', instruments='BTC'):
+        exchange = FBMExchange(times_to_generate=1000)
+
+    exchange.reset()
+    exchange.current_price(symbol='BTC')
+
+    exchange.reset()
+
+    assert exchange.current_price(symbol='BTC') == float(exchange._price_history.iloc[0])
+
+
+def test_observation_space_is_rebuilt_after_changes():
+
+    with TradingContext(base_instrument='USD', instruments='BTC'):
+        exchange = SimulatedExchange(data_frame=make_data_frame(0))
+
+    observation_space = exchange.observation_space
+
+    assert observation_space.shape == (5,)
+    assert exchange.observation_space is observation_space
+
+    exchange.window_size = 3
+
+    assert exchange.observation_space.shape == (3, 5)
+
+    exchange.dtype = np.float64
+
+    assert exchange.observation_space.dtype == np.float64
+
+    exchange.data_frame = make_data_frame(0).drop(columns=['volume'])
+
+    assert exchange.observation_space.shape == (3, 4)
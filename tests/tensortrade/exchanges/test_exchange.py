@@ -1,8 +1,95 @@
 from typing import Generator, List, Dict
 
+import numpy as np
 import pandas as pd
 from gym import Space
 
 from tensortrade import TradingContext
 from tensortrade.exchanges import Exchange
 from tensortrade.trades import Trade
+
+
+class FixedBalanceExchange(Exchange):
+
+    def __init__(self, initial_balance: float, balance: float):
+        super(FixedBalanceExchange, self).__init__()
+
+        self._initial_balance = initial_balance
+        self._balance = balance
+
+    @property
+    def initial_balance(self) -> float:
+        return self._initial_balance
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+    @property
+    def portfolio(self) -> Dict[str, float]:
+        return {}
+
+    @property
+    def trades(self) -> List[Trade]:
+        return []
+
+    @property
+    def performance(self) -> pd.DataFrame:
+        pass
+
+    @property
+    def observation_columns(self) -> List[str]:
+        pass
+
+    @property
+    def has_next_observation(self) -> bool:
+        return False
+
+    def current_price(self, symbol: str) -> float:
+        pass
+
+    def execute_trade(self, trade: Trade) -> Trade:
+        pass
+
+    def reset(self):
+        pass
+
+
+def test_profit_loss_percent_without_base_reset():
+
+    with TradingContext(base_instrument='USD', instruments='BTC'):
+        exchange = FixedBalanceExchange(initial_balance=1e4, balance=5e3)
+
+    assert exchange.profit_loss_percent == 50
+
+
+def test_reset_with_zero_initial_balance():
+
+    with TradingContext(base_instrument='USD', instruments='BTC'):
+        exchange = FixedBalanceExchange(initial_balance=0, balance=0)
+
+    Exchange.reset(exchange)
+
+    assert exchange.net_worth == 0
+
+
+def test_next_observation_with_mixed_dtypes():
+
+    class MixedObservationExchange(FixedBalanceExchange):
+
+        def _next_observation(self) -> pd.DataFrame:
+            return pd.DataFrame({
+                'side': [True, False],
+                'price': [1.5, np.nan],
+                'cost': [None, 2.0]
+            }, columns=['side', 'price', 'cost'])
+
+    with TradingContext(base_instrument='USD', instruments='BTC'):
+        exchange = MixedObservationExchange(initial_balance=1e4, balance=1e4)
+
+    observation = exchange.next_observation()
+
+    assert observation.shape == (2, 3)
+    assert observation[1, 1] == 0
+    assert observation[0, 2] == 0
+    assert observation[1, 2] == 2.0
@@ -0,0 +1,66 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from tensortrade import TradingContext
+from tensortrade.exchanges import VectorizedExchange
+from tensortrade.exchanges.simulated import SimulatedExchange
+
+
+def make_data_frame(offset: float) -> pd.DataFrame:
+    data_frame = pd.DataFrame({
+        'open': np.arange(10) + offset,
+        'high': np.arange(10) + offset + 0.5,
+        'low': np.arange(10) + offset - 0.5,
+        'close': np.arange(10) + offset + 0.1,
+        'volume': np.full(10, 1000.0)
+    })
+    data_frame.loc[2, 'volume'] = np.nan
+
+    return data_frame
+
+
+def test_batched_next_observation():
+
+    with TradingContext(base_instrument='USD', instruments='BTC'):
+        exchanges = [SimulatedExchange(data_frame=make_data_frame(offset), window_size=3)
+                     for offset in (0, 100)]
+
+    vectorized_exchange = VectorizedExchange(exchanges)
+    vectorized_exchange.reset()
+
+    for _ in range(4):
+        observations = vectorized_exchange.batched_next_observation()
+
+    assert observations.shape == (2, 3, 5)
+    assert not np.isnan(observations).any()
+    assert observations[0, -1, 0] == 3
+    assert observations[1, -1, 0] == 103
+    assert observations[0, 1, 4] == 0
+
+
+def test_rejects_mismatched_observation_columns():
+
+    with TradingContext(base_instrument='USD', instruments='BTC'):
+        exchanges = [SimulatedExchange(data_frame=make_data_frame(0), window_size=3),
+                     SimulatedExchange(data_frame=make_data_frame(100).drop(columns=['volume']), window_size=3)]
+
+    with pytest.raises(ValueError):
+        VectorizedExchange(exchanges)
+
+
+def test_reallocates_when_window_size_changes():
+
+    with TradingContext(base_instrument='USD', instruments='BTC'):
+        exchanges = [SimulatedExchange(data_frame=make_data_frame(offset), window_size=3)
+                     for offset in (0, 100)]
+
+    vectorized_exchange = VectorizedExchange(exchanges)
+    vectorized_exchange.reset()
+
+    assert vectorized_exchange.batched_next_observation().shape == (2, 3, 5)
+
+    for exchange in exchanges:
+        exchange.window_size = 4
+
+    assert vectorized_exchange.batched_next_observation().shape == (2, 4, 5)